@@ -3,9 +3,10 @@ The class is used for Task Manager creation.
 """
 
 from collections import deque
+from itertools import chain
 from .task import Task
-from .priority import Priority
-from .libs import mlogger, MaxTaskSizeError, DuplicateTaskError, EmptyTaskManagerError, InactiveTaskError
+from .priority import Priority, PRIORITY_BY_VALUE_ASC, _MIN_PRIO_VALUE
+from .libs import module_logger, MaxTaskSizeError, DuplicateTaskError, EmptyTaskManagerError, InactiveTaskError
 
 
 class TaskManager:
@@ -45,6 +46,8 @@ class TaskManager:
 
         list_running_tasks()
             Lists running tasks based on: Creation time, pid or priority ("ctime", "pid", "priority")
+        contains_pid()
+            Checks if a task with given pid is in task manager.
 
     Raises
     ------
@@ -82,7 +85,13 @@ class TaskManager:
 
         self.__max_queue_size = max_queue_size
         self.tasks_queue = deque([], self.__max_queue_size)
+        # pids of the tasks in queue, kept in sync with tasks_queue for O(1) duplicate lookups.
+        self._pid_index = set()
+        # Number of tasks in queue, kept in sync with tasks_queue by the same helpers as _pid_index.
+        self._count = 0
         self.__run_mode = run_mode
+        # run_mode is fixed between set_run_method calls, so the full queue handler is picked once here.
+        self._add_full = self._get_full_queue_handler(run_mode)
         self.verbose = verbose
         self.duplicates_allowed = duplicates_allowed
 
@@ -90,13 +99,38 @@ class TaskManager:
 
         if self.duplicates_allowed:
             return self.duplicates_allowed
-        if task.get_pid in [elem.get_pid for elem in self.tasks_queue]:
+        if task.pid in self._pid_index:
             raise DuplicateTaskError("A job with given pid is already in queue.")
             # if self.verbose:
             #    mlogger("This task is already added.")
             # return False
         return True
 
+    def _get_full_queue_handler(self, run_mode: str):
+        """Returns the method that adds a task to a filled tasks queue for given run_mode."""
+        return {"default": self._add_default_full,
+                "fifo": self._add_fifo,
+                "priority": self._add_priority_based}[run_mode]
+
+    def _append(self, task: Task) -> None:
+        """Appends a task to the tasks queue and registers its pid."""
+        # A full deque with maxlen drops its oldest task on append, which has to be unregistered as well.
+        evicted_task = self.tasks_queue[0] if len(self.tasks_queue) == self.tasks_queue.maxlen else None
+        self.tasks_queue.append(task)
+        self._pid_index.add(task.pid)
+        self._count += 1
+        if evicted_task is not None:
+            self._forget(evicted_task)
+
+    def _forget(self, task: Task) -> None:
+        """Unregisters a task that has been removed from the tasks queue."""
+        self._count -= 1
+        pid = task.pid
+        # With duplicates allowed, other tasks in queue may still carry the same pid.
+        if self.duplicates_allowed and any(elem.pid == pid for elem in self.tasks_queue):
+            return
+        self._pid_index.discard(pid)
+
     def print_max_queue_size(self) -> None:
         """Prints size of container
         """
@@ -122,6 +156,7 @@ class TaskManager:
         """sets new value to run_mode."""
         if isinstance(new_run_mode, str) and new_run_mode in ("default", "fifo", "priority"):
             self.__run_mode = new_run_mode
+            self._add_full = self._get_full_queue_handler(new_run_mode)
         else:
             print("'new_run_mode' can only be in ('default', 'fifo', 'priority')")
 
@@ -131,11 +166,20 @@ class TaskManager:
 
     @property
     def filled_size(self) -> int:
-        return len(self.tasks_queue)
+        return self._count
 
     @property
     def get_empty_slots(self):
-        return self.__max_queue_size - len(self.tasks_queue)
+        return self.__max_queue_size - self._count
+
+    @property
+    def pids(self) -> frozenset:
+        """Returns pids of the tasks in task manager."""
+        return frozenset(self._pid_index)
+
+    def contains_pid(self, pid: str) -> bool:
+        """Checks if a task with given pid is in task manager."""
+        return pid in self._pid_index
 
     def add(self, task: Task) -> None:
         """
@@ -146,18 +190,22 @@ class TaskManager:
             raise InactiveTaskError("Inactive jobs can not be added to task manager.")
 
         if self.filled_size >= self.__max_queue_size:
-            if self.__run_mode == "default":
-                error_message = "Task manager does not have free job slot."
-                raise MaxTaskSizeError(error_message)
-                # mlogger(error_message)
-                # return
-            elif self.__run_mode == 'fifo':
-                self._add_fifo(task)
-            elif self.__run_mode == 'priority':
-                self._add_priority_based(task)
+            self._add_full(task)
         else:
             self._add(task)
 
+    def _add_default_full(self, task: Task):
+        """
+       Handles addition of a task to filled tasks queue in "default" run mode, by raising an error.
+
+       Parameters
+       -----------
+            task : Task
+                An instance of Task class
+       """
+        error_message = "Task manager does not have free job slot."
+        raise MaxTaskSizeError(error_message)
+
     def _add_fifo(self, task: Task):
         """
        Adds a task to the tasks queue. If the queue is full, the oldest task will be removed
@@ -168,8 +216,10 @@ class TaskManager:
                 An instance of Task class
        """
         if self._check_if_task_not_exists(task):
-            _ = self.tasks_queue.popleft()
-            self.tasks_queue.append(task)
+            if len(self.tasks_queue) < self.tasks_queue.maxlen:
+                # max_queue_size has been lowered with set_max_queue_size, deque bound does not evict here.
+                self._forget(self.tasks_queue.popleft())
+            self._append(task)
 
     def _add(self, task: Task):
         """
@@ -181,7 +231,7 @@ class TaskManager:
                 An instance of Task class
        """
         if self._check_if_task_not_exists(task):
-            self.tasks_queue.append(task)
+            self._append(task)
 
     def _add_priority_based(self, new_task: Task):
         """
@@ -195,53 +245,54 @@ class TaskManager:
                 New task to be added to container.
         """
 
-        # If new task has smallest priority. Return.
-        if new_task.get_priority.value == min(Priority).value:
-            mlogger("Task has smallest possible priority and can not be replaced with existing tasks in task manager.")
-            return
+        new_value = new_task._prio_value
 
-        # Set index_to_remove to -1 and update it in the following loop. If it gets updated and its value changes,
-        # Then we have found a task with lower priority which was oldest.
-        index_to_remove = -1
-        current_index = 0
-        previous_low_priority = -1
-        check_dup_status = not self.duplicates_allowed
+        if not self.duplicates_allowed and new_task.pid in self._pid_index:
+            if self.verbose:
+                module_logger.info("Task is already in task manager.")
+            return
 
-        for task in self.tasks_queue:
-            if check_dup_status:
-                if new_task.get_pid == task.get_pid:
-                    mlogger("Task is already in task manager.")
-                    return
-            if new_task.get_priority > task.get_priority:
-                if index_to_remove == -1 and previous_low_priority == -1:
+        # If new task has smallest priority. Return.
+        if new_value == _MIN_PRIO_VALUE:
+            if self.verbose:
+                module_logger.info("Task has smallest possible priority and can not be replaced with existing tasks "
+                                   "in task manager.")
+            return
 
-                    # Record occurrence of first low priority and update indicators
-                    index_to_remove = current_index
-                    previous_low_priority = task.get_priority
+        # task_to_remove is updated in the following loop. If it is set, then we have found a task with lower
+        # priority which was oldest, at position index_to_remove of tasks queue.
+        # Only a strictly lower priority replaces the current candidate, so among equals the oldest one is kept.
+        task_to_remove = None
+        index_to_remove = None
+        lowest_value = new_value
 
-                # This will only run if we have previously found one replacement and current task priority is smaller
-                elif index_to_remove != -1 and task.get_priority < previous_low_priority:
-                    index_to_remove = current_index
-                    previous_low_priority = task.get_priority
+        for index, task in enumerate(self.tasks_queue):
+            if task._prio_value < lowest_value:
+                index_to_remove = index
+                task_to_remove = task
+                lowest_value = task._prio_value
 
-            current_index = current_index + 1
+                # Nothing has lower priority than the smallest one, so this is the oldest lowest priority task.
+                if lowest_value == _MIN_PRIO_VALUE:
+                    break
 
-        if index_to_remove == -1:
+        if task_to_remove is None:
             # We skip it and do not raise Exception.
             if self.verbose:
-                message = f"Queue is full and there is no task with lower " \
-                          f"priority than new task's priority, '{new_task.get_priority.name}', to be removed."
-                mlogger(message)
+                module_logger.info("Queue is full and there is no task with lower priority than new task's "
+                                   "priority, '%s', to be removed.", new_task.priority.name)
             return
 
+        # tasks_queue stays a bounded deque, fifo mode and the size bound rely on its maxlen.
         del self.tasks_queue[index_to_remove]
-        self.tasks_queue.append(new_task)
+        self._forget(task_to_remove)
+        self._append(new_task)
 
 
     def kill_all_tasks(self) -> None:
         """Kills all the tasks in task manager."""
         if self.verbose:
-            mlogger("Killing all of the tasks queue.")
+            module_logger.info("Killing all of the tasks queue.")
 
         for task in self.tasks_queue:
             task.kill()
@@ -249,7 +300,19 @@ class TaskManager:
 
     def kill_task(self, pid: str) -> None:
         """Kills task by task's pid identifier."""
-        self.tasks_queue = [elem for elem in self.tasks_queue if elem.get_pid != pid]
+        if pid not in self._pid_index:
+            return
+        if self.duplicates_allowed:
+            self.tasks_queue = deque((elem for elem in self.tasks_queue if elem.pid != pid),
+                                     self.tasks_queue.maxlen)
+        else:
+            # pid is unique in queue, remove its only task in place.
+            for index, elem in enumerate(self.tasks_queue):
+                if elem.pid == pid:
+                    del self.tasks_queue[index]
+                    break
+        self._pid_index.discard(pid)
+        self._count = len(self.tasks_queue)
 
     def kill_by_group(self, group: str = None, match: str = None) -> None:
         """
@@ -270,17 +333,23 @@ class TaskManager:
             raise ValueError("'group can only be in ('priority' , 'pid')'")
 
         if group == 'priority':
-            self.tasks_queue = [elem for elem in self.tasks_queue if elem.get_priority.name != match]
+            remaining_tasks = (elem for elem in self.tasks_queue if elem.priority.name != match)
         else:
-            self.tasks_queue = [elem for elem in self.tasks_queue if not elem.get_pid.startswith(match)]
+            remaining_tasks = (elem for elem in self.tasks_queue if not elem.pid.startswith(match))
+        # Rebuild with the same bound, so tasks_queue remains a deque of max_queue_size.
+        self.tasks_queue = deque(remaining_tasks, self.tasks_queue.maxlen)
+        self._pid_index = {elem.pid for elem in self.tasks_queue}
+        self._count = len(self.tasks_queue)
 
     def _clear_tasks_queue(self, verbose=None):
         """Clears tasks queue"""
         if verbose is None:
             verbose = self.verbose
         if verbose:
-            mlogger("Clearing the tasks queue.")
+            module_logger.info("Clearing the tasks queue.")
         self.tasks_queue.clear()
+        self._pid_index.clear()
+        self._count = 0
 
     def list_running_tasks(self, by: str = "ctime", reverse: bool = False):
         """
@@ -295,16 +364,25 @@ class TaskManager:
             Default False that means do nor reverse the sort direction.
         """
         if by not in ("ctime", "pid", "priority"):
-            mlogger("'by' parameter is not well defined. Acceptable values are: ('ctime', 'pid', 'priority')")
+            if self.verbose:
+                module_logger.info("'by' parameter is not well defined. Acceptable values are: ('ctime', 'pid', "
+                                   "'priority')")
             return
         if self.verbose:
-            if self.verbose:
-                mlogger(f"Printing list of running tasks by '{by}'.")
+            module_logger.info("Printing list of running tasks by '%s'.", by)
         if self.filled_size == 0:
-            mlogger("Tasks queue is empty")
+            if self.verbose:
+                module_logger.info("Tasks queue is empty")
             return
         if by == "ctime":
             return list(self.tasks_queue) if not reverse else list(self.tasks_queue)[::-1]
+        elif by == "priority":
+            # Priority has few levels, so bucket tasks in one pass instead of sorting them.
+            # Buckets go from lowest to highest priority and keep creation time order within each level.
+            buckets = {priority: [] for priority in PRIORITY_BY_VALUE_ASC}
+            for task in self.tasks_queue:
+                buckets[task.priority].append(task)
+            ordered_buckets = list(buckets.values())
+            return list(chain.from_iterable(ordered_buckets[::-1] if reverse else ordered_buckets))
         else:
-            return sorted(self.tasks_queue, key=lambda t: t.get_priority, reverse=reverse) if by == "priority" \
-                else sorted(self.tasks_queue, key=lambda t: t.get_pid, reverse=reverse)
\ No newline at end of file
+            return sorted(self.tasks_queue, key=lambda t: t.pid, reverse=reverse)
\ No newline at end of file
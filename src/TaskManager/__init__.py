@@ -1,8 +1,9 @@
 from .TaskManager import TaskManager, Task, Priority, MaxTaskSizeError, \
     DuplicateTaskError, EmptyTaskManagerError, InactiveTaskError
-from .libs import mlogger, py_logger, get_config
-from .priority import Priority
-__all__ = ["TaskManager", "Task", "Priority", "mlogger", "py_logger", "get_config",
+from .libs import module_logger, mlogger, py_logger, get_config
+from .priority import Priority, PRIORITY_MIN, PRIORITY_MAX, PRIORITY_BY_VALUE_ASC
+__all__ = ["TaskManager", "Task", "Priority", "PRIORITY_MIN", "PRIORITY_MAX", "PRIORITY_BY_VALUE_ASC",
+           "module_logger", "mlogger", "py_logger", "get_config",
            "MaxTaskSizeError", "DuplicateTaskError", "EmptyTaskManagerError", "InactiveTaskError"]
 
 
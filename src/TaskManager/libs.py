@@ -1,16 +1,37 @@
 """
 This module provides some helper functions for:
-    Module logging: mlogger
+    Module logging: module_logger and mlogger
     Pipeline logging: py_logger
     Yaml file reader and parser: get_config
 """
 
-from typing import Dict
-import time
+from typing import Dict, Tuple
+import sys
 import logging
 import pathlib
 import yaml
 
+try:
+    # libyaml C binding, considerably faster than the pure Python loader.
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+# Parsed config files, keyed by file path and holding (st_mtime_ns, parsed content).
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict]] = {}
+
+
+# Module logger, set up once at import. Records go to stdout in the same layout mlogger used to print.
+module_logger = logging.getLogger("TaskManager")
+if not module_logger.handlers:
+    _stream_handler = logging.StreamHandler(sys.stdout)
+    _stream_handler.setFormatter(logging.Formatter('[%(levelname)s - %(asctime)s]: %(message)s',
+                                                   datefmt='%m/%d/%Y, %H:%M:%S'))
+    module_logger.addHandler(_stream_handler)
+    module_logger.setLevel(logging.INFO)
+    module_logger.propagate = False
+
 
 class MaxTaskSizeError(Exception):
     pass
@@ -30,7 +51,7 @@ class InactiveTaskError(Exception):
 
 def mlogger(message: str = " ", level: str = "INFO") -> None:
     """
-    Creates simple module logger
+    Logs a message through the module logger.
 
     Parameters:
     -----------
@@ -39,15 +60,15 @@ def mlogger(message: str = " ", level: str = "INFO") -> None:
        level: str
             Default to INFO (At the moment only INFO is implemented.)
        """
-    named_tuple = time.localtime()  # get struct_time
-    time_string = time.strftime("%m/%d/%Y, %H:%M:%S", named_tuple)
     if level == "INFO":
-        print(f"[INFO - {time_string}]: {message}")
+        module_logger.info(message)
 
 
 def get_config(conf_file) -> Dict:  # : pathlib.PosixPath
     """
     YAML config file parser.
+    Parsed content is cached per file and reused for as long as the file modification time does not change.
+    The returned dict is shared between calls, copy it before modifying.
 
     Parameters:
     -----------
@@ -59,10 +80,16 @@ def get_config(conf_file) -> Dict:  # : pathlib.PosixPath
         conf_file = pathlib.Path(conf_file)
 
     if conf_file.is_file() and conf_file.suffix == '.yaml':
+        cache_key = str(conf_file)
+        mtime = conf_file.stat().st_mtime_ns
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         with open(conf_file, mode="r") as stream:
-            conf = yaml.safe_load(stream.read())
+            conf = yaml.load(stream, Loader=YamlLoader)
+        _CONFIG_CACHE[cache_key] = (mtime, conf)
     else:
-        mlogger(f"The input file '{conf_file}' is: not valid file or does not exists.")
+        module_logger.info("The input file '%s' is: not valid file or does not exists.", conf_file)
         return dict()
     return conf
 
@@ -88,7 +115,11 @@ def py_logger(name="__name__", log_path="",
 
     formatter = formatter
     logger = logging.getLogger(name)
+    # Loggers are singletons per name, handlers are attached only on first call to avoid duplicated records.
+    if logger.handlers:
+        return logger
     logger.setLevel(level)
+    logger.propagate = False
 
     file_handler = logging.FileHandler(log_path)
     file_handler.setLevel(logging.INFO)
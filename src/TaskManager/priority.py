@@ -12,3 +12,11 @@ class Priority(Enum):
         if self.__class__ is other.__class__:
             return self.value < other.value
         return NotImplemented
+
+
+# Computed once at import instead of iterating and comparing members on every use.
+PRIORITY_MIN = min(Priority)
+PRIORITY_MAX = max(Priority)
+PRIORITY_BY_VALUE_ASC = tuple(sorted(Priority, key=lambda p: p.value))
+
+_MIN_PRIO_VALUE = PRIORITY_MIN.value
@@ -17,7 +17,8 @@ class Task:
      pid : UUID.hex
          Represents pid (id) of task
      priority: : Priority
-         Represents priority of ask
+         Represents priority of ask. Assigning it, directly or through set_priority(), also updates the
+         integer copy task manager uses for priority comparisons.
      is_active : bool
          Shows status of task
 
@@ -30,12 +31,15 @@ class Task:
         Used to update task property
 
 
-    property attributes
+    property attributes (kept for backward compatibility, same as pid and priority)
    --------------------
    get_pid
    get_priority
      """
 
+    # Fixed attribute layout: no per-instance __dict__ for tasks that live in task manager queues.
+    __slots__ = ("pid", "_priority", "is_active", "_prio_value")
+
     def __init__(self, pid: UUID.hex, priority: Priority, is_active: bool = True):
         """
         Constructs all the necessary attributes for the task object.
@@ -50,8 +54,8 @@ class Task:
                 Shows status of task
                 """
 
-        self.__pid = pid
-        self.__priority = priority
+        self.pid = pid
+        self.priority = priority
         self.is_active = is_active
 
     def kill(self) -> None:
@@ -65,32 +69,50 @@ class Task:
         """
         self.is_active = False
 
+    @property
+    def priority(self) -> Priority:
+        """Priority of task"""
+        return self._priority
+
+    @priority.setter
+    def priority(self, value: Priority) -> None:
+        if not isinstance(value, Priority):
+            raise TypeError(f"{value} is not of type 'Priority'. Please provide a valid value!")
+        self._priority = value
+        # Plain int copy of priority value for fast comparisons in task manager, kept in sync here.
+        self._prio_value = value.value
+
     @property
     def get_pid(self):
         """Helper to return pid of task"""
-        return self.__pid
+        return self.pid
 
     @property
     def get_priority(self) -> Priority:
         """Helper to return priority of task"""
-        return self.__priority
+        return self.priority
 
     # def set_pid(self, value) -> None:
     #     """Helper to set pid of task"""
-    #     self.__pid = value
+    #     self.pid = value
 
     def set_priority(self, value) -> None:
         """Helper to set priority of task."""
         if isinstance(value, Priority):
-            self.__priority = value
+            self.priority = value
         else:
             print(f"{value} is not of type 'Priority'. Please provide a valid value!")
 
     def __eq__(self, other) -> bool:
-        return True if self.__pid == other.__pid else False
+        if not isinstance(other, Task):
+            return NotImplemented
+        return self.pid == other.pid
+
+    def __hash__(self) -> int:
+        return hash(self.pid)
 
     def __repr__(self) -> str:
-        return f"Task(pid='{self.__pid}', priority= <{self.__priority.name}:{self.__priority.value}>, is_active={self.is_active}) "
+        return f"Task(pid='{self.pid}', priority= <{self.priority.name}:{self.priority.value}>, is_active={self.is_active}) "
 
     def __str__(self) -> str:
-        return f"pid='{self.__pid}', priority= <{self.__priority.name}:{self.__priority.value}>, is_active={self.is_active}"
+        return f"pid='{self.pid}', priority= <{self.priority.name}:{self.priority.value}>, is_active={self.is_active}"
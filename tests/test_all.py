@@ -1,7 +1,9 @@
 import pytest
+import os
 import uuid
 
-from src.TaskManager import TaskManager, Task, Priority, MaxTaskSizeError, DuplicateTaskError, EmptyTaskManagerError, InactiveTaskError
+from src.TaskManager import TaskManager, Task, Priority, MaxTaskSizeError, DuplicateTaskError, EmptyTaskManagerError, InactiveTaskError, \
+    get_config, py_logger
 
 
 @pytest.fixture
@@ -87,11 +89,11 @@ def test_priority_based_additions():
     task_manager.add(task=task2)
     task_manager.add(task=task3)
 
-    t1 = tuple(sorted([elem.get_pid for elem in task_manager.tasks_queue]))
+    t1 = task_manager.pids
 
     task_manager.add(task4)
 
-    t2 = tuple(sorted([elem.get_pid for elem in task_manager.tasks_queue]))
+    t2 = task_manager.pids
     assert t1 == t2
 
 
@@ -125,7 +127,7 @@ def test_adding_high_priority_task():
     pid9 = task9.get_pid
     task_manager.add(task9)
 
-    assert pid3 not in [elem.get_pid for elem in task_manager.tasks_queue]
+    assert not task_manager.contains_pid(pid3)
     assert [elem.get_pid for elem in task_manager.tasks_queue][7] == pid9
 
 
@@ -143,7 +145,7 @@ def test_killing_single_task_by_pid(default_task_manager):
     default_task_manager.kill_task(task_id)
     size_f = default_task_manager.filled_size
     assert size_i == size_f + 1
-    assert not task_id in [elem.get_pid for elem in default_task_manager.tasks_queue]
+    assert not default_task_manager.contains_pid(task_id)
 
 
 def test_kill_all_tasks(default_task_manager):
@@ -182,4 +184,186 @@ def test_fifo_mode_with_first_task_addition():
         taskManager.add(task4)
 
         # Adding first task again!
-        taskManager.add(task1)
\ No newline at end of file
+        taskManager.add(task1)
+
+
+def test_re_adding_task_after_removal():
+    """A task removed from task manager by pid should not be reported as duplicate anymore."""
+    task_manager = TaskManager(max_queue_size=3, verbose=False)
+    task1 = Task(uuid.uuid4().hex, Priority.medium)
+    task2 = Task(uuid.uuid4().hex, Priority.low)
+
+    task_manager.add(task1)
+    task_manager.add(task2)
+    task_manager.kill_task(task1.get_pid)
+
+    # Should not raise DuplicateTaskError
+    task_manager.add(task1)
+    assert task_manager.filled_size == 2
+
+
+def test_get_config_reloads_modified_file(tmp_path):
+    """Cached config should be reused until the file is modified."""
+    conf_file = tmp_path / "config.yaml"
+    conf_file.write_text("task_number: 4\n")
+    conf = get_config(conf_file)
+    assert conf == {"task_number": 4}
+    assert get_config(str(conf_file)) is conf
+
+    conf_file.write_text("task_number: 8\n")
+    os.utime(conf_file, ns=(conf_file.stat().st_atime_ns, conf_file.stat().st_mtime_ns + 10**9))
+    assert get_config(conf_file) == {"task_number": 8}
+
+
+def test_fifo_addition_after_killing_tasks():
+    """Killing tasks should keep the bounded queue, so fifo replacement still works afterwards."""
+    task_manager = TaskManager(3, run_mode="fifo", verbose=False)
+    tasks = [Task(uuid.uuid4().hex, Priority.medium) for _ in range(5)]
+    for task in tasks[:3]:
+        task_manager.add(task)
+
+    task_manager.kill_task(tasks[1].get_pid)
+    task_manager.kill_by_group("priority", "low")
+    task_manager.add(tasks[3])
+    task_manager.add(tasks[4])
+
+    assert [elem.get_pid for elem in task_manager.tasks_queue] == [tasks[i].get_pid for i in (2, 3, 4)]
+
+
+def test_list_running_tasks_by_priority():
+    """Tasks are listed by priority and, within the same priority, by creation time."""
+    task_manager = TaskManager(6, verbose=False)
+    priorities = (Priority.medium, Priority.low, Priority.high, Priority.low, Priority.high, Priority.medium)
+    tasks = [Task(uuid.uuid4().hex, priority) for priority in priorities]
+    for task in tasks:
+        task_manager.add(task)
+
+    assert task_manager.list_running_tasks(by="priority") == sorted(tasks, key=lambda t: t.get_priority)
+    assert task_manager.list_running_tasks(by="priority", reverse=True) == \
+        sorted(tasks, key=lambda t: t.get_priority, reverse=True)
+
+
+def test_task_equality_and_hash():
+    """Tasks are equal and hash alike by pid, and can be compared with other types."""
+    pid = uuid.uuid4().hex
+    task1 = Task(pid, Priority.low)
+    task2 = Task(pid, Priority.high)
+
+    assert task1 == task2
+    assert task1 != pid
+    assert len({task1, task2}) == 1
+
+
+def test_set_run_method_changes_full_queue_behaviour():
+    """After switching run mode to fifo, a filled task manager replaces its oldest task instead of raising."""
+    task_manager = TaskManager(2, verbose=False)
+    tasks = [Task(uuid.uuid4().hex, Priority.medium) for _ in range(3)]
+    task_manager.add(tasks[0])
+    task_manager.add(tasks[1])
+    with pytest.raises(MaxTaskSizeError):
+        task_manager.add(tasks[2])
+
+    task_manager.set_run_method("fifo")
+    task_manager.add(tasks[2])
+    assert [elem.get_pid for elem in task_manager.tasks_queue] == [tasks[1].get_pid, tasks[2].get_pid]
+
+
+def test_py_logger_attaches_handlers_once(tmp_path):
+    """Calling py_logger repeatedly with the same name should not stack handlers."""
+    log_path = str(tmp_path / "run.log")
+    logger = py_logger(name="test_py_logger", log_path=log_path)
+    try:
+        assert py_logger(name="test_py_logger", log_path=log_path) is logger
+        assert len(logger.handlers) == 2
+    finally:
+        # Logger is process wide, detach and close handlers so they do not outlive tmp_path.
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def test_priority_mode_removes_oldest_lowest_priority_task():
+    """A high priority task replaces the oldest task with the lowest priority, not the first lower one."""
+    task_manager = TaskManager(4, run_mode="priority", verbose=False)
+    tasks = [Task(uuid.uuid4().hex, priority)
+             for priority in (Priority.medium, Priority.low, Priority.high, Priority.low)]
+    for task in tasks:
+        task_manager.add(task)
+
+    new_task = Task(uuid.uuid4().hex, Priority.high)
+    task_manager.add(new_task)
+    assert [elem.get_pid for elem in task_manager.tasks_queue] == \
+        [tasks[0].get_pid, tasks[2].get_pid, tasks[3].get_pid, new_task.get_pid]
+
+
+def test_task_has_fixed_attributes():
+    """Task uses __slots__, so undefined attributes can not be set on it."""
+    task = Task(uuid.uuid4().hex, Priority.low)
+    with pytest.raises(AttributeError):
+        task.group = "batch"
+
+
+def test_filled_size_after_raising_max_queue_size():
+    """Counters follow the queue when its deque bound evicts a task after max_queue_size was raised."""
+    task_manager = TaskManager(2, verbose=False)
+    for _ in range(2):
+        task_manager.add(Task(uuid.uuid4().hex, Priority.medium))
+
+    task_manager.set_max_queue_size(4)
+    task_manager.add(Task(uuid.uuid4().hex, Priority.medium))
+
+    assert task_manager.filled_size == len(task_manager.tasks_queue) == 2
+    assert task_manager.get_empty_slots == 2
+
+
+def test_re_adding_task_evicted_by_queue_bound():
+    """A task dropped by the deque bound after max_queue_size was raised is no longer known by pid."""
+    task_manager = TaskManager(2, verbose=False)
+    task1 = Task(uuid.uuid4().hex, Priority.medium)
+    task_manager.add(task1)
+    task_manager.add(Task(uuid.uuid4().hex, Priority.medium))
+
+    task_manager.set_max_queue_size(4)
+    task_manager.add(Task(uuid.uuid4().hex, Priority.medium))
+    assert not task_manager.contains_pid(task1.get_pid)
+
+    # Should not raise DuplicateTaskError
+    task_manager.add(task1)
+    assert task_manager.contains_pid(task1.get_pid)
+
+
+def test_task_hash_follows_pid():
+    """Equal tasks hash alike, also after pid of a task has been reassigned."""
+    task1 = Task(uuid.uuid4().hex, Priority.low)
+    task2 = Task(uuid.uuid4().hex, Priority.low)
+    task1.pid = task2.pid
+
+    assert task1 == task2
+    assert hash(task1) == hash(task2)
+
+
+def test_priority_mode_after_reassigning_task_priority():
+    """Priority mode uses the current priority of a task, also when it was assigned directly."""
+    task_manager = TaskManager(2, run_mode="priority", verbose=False)
+    task1 = Task(uuid.uuid4().hex, Priority.low)
+    task2 = Task(uuid.uuid4().hex, Priority.medium)
+    task_manager.add(task1)
+    task_manager.add(task2)
+
+    task1.priority = Priority.high
+    new_task = Task(uuid.uuid4().hex, Priority.high)
+    task_manager.add(new_task)
+
+    assert task_manager.pids == {task1.get_pid, new_task.get_pid}
+
+
+def test_rejected_priority_assignment_leaves_task_unchanged():
+    """Assigning a non Priority value raises TypeError and keeps the previous priority."""
+    task = Task(uuid.uuid4().hex, Priority.high)
+    with pytest.raises(TypeError):
+        task.priority = "low"
+
+    assert task.priority is Priority.high
+    assert task._prio_value == Priority.high.value
+    with pytest.raises(TypeError):
+        Task(uuid.uuid4().hex, 3)